@@ -1,19 +1,43 @@
 import sys
+import math
+from math import cos, sin
+import struct
+import asyncio
 import numpy as np
-import threading
-import websocket
+import qasync
+import websockets
 import json
 import logging
 import pygame  # Added for gamepad support
 
+try:
+    import orjson  # Faster JSON decoder, optional
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit  # JIT for the kinematics kernel, optional
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QSlider, QGroupBox, QMainWindow, QButtonGroup
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker, pyqtSignal
+from PyQt5.QtGui import QFont, QVector3D
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Imported after PyQt5 so pyqtgraph builds on the same Qt binding
+try:
+    import pyqtgraph.opengl as gl  # OpenGL arm view, optional
+except ImportError:
+    gl = None
+if gl is not None and not hasattr(gl, 'GLTextItem'):
+    gl = None  # pyqtgraph older than 0.12.2 has no 3D text labels
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,19 +45,86 @@ logger = logging.getLogger(__name__)
 # Arm segment lengths
 L1, L2, L3 = 10, 10, 5
 
+# PWM sign for each motor state (0: stop, 1: forward, 2: backward)
+MOTOR_DIRECTION = (0, 1, -1)
+
+# Attribute holding the state of each control
+MOTOR_STATE_ATTRS = {'base': 'base_state', 'shoulder': 'shoulder_state', 'elbow': 'elbow_state'}
+GRIPPER_ROLLER_STATE_ATTRS = {'gripper': 'gripper_state', 'roller': 'roller_state'}
+
+# Plot angle conversions: signed PWM maps linearly onto +/-90 degrees
+DEG_TO_RAD = math.pi / 180.0
+PWM_TO_RAD = 90.0 / 1023.0 * DEG_TO_RAD
+
+# Matplotlib fallback draws a fixed-view 2D projection; set True for rotatable 3D axes
+MPL_PLOT_3D = False
+
+# Orthographic projection onto the screen for matplotlib's default view (azim -60, elev 30)
+PLOT_AZIM, PLOT_ELEV = -60 * DEG_TO_RAD, 30 * DEG_TO_RAD
+PLOT_PROJECTION = np.array([
+    [-sin(PLOT_AZIM), -sin(PLOT_ELEV) * cos(PLOT_AZIM)],
+    [cos(PLOT_AZIM), -sin(PLOT_ELEV) * sin(PLOT_AZIM)],
+    [0.0, cos(PLOT_ELEV)],
+])
+
+# Binary arm control frame: gripper, roller, servo, elbow, shoulder, base (signed PWMs)
+ARM_FRAME = struct.Struct('<BBHhhh')
+
+# Application-wide stylesheet, parsed once by QApplication
+APP_STYLESHEET = """
+    #controlPanel, #controlPanel QWidget { background-color: #f4f4f4; }
+    #controlPanel QGroupBox { border: 1px solid #cccccc; border-radius: 8px; margin-top: 1.5ex; padding: 10px; }
+    #controlPanel QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+    #controlPanel QPushButton { background-color: #2b2d42; color: white; border-radius: 8px; padding: 8px; font-weight: bold; }
+    #controlPanel QPushButton:hover { background-color: #1f2235; }
+    #controlPanel QPushButton:checked { background-color: #4a4d6d; }
+    #controlPanel QSlider::groove:horizontal { background: #cccccc; height: 10px; border-radius: 5px; }
+    #controlPanel QSlider::handle:horizontal { background: #2b2d42; width: 30px; height: 30px; border-radius: 15px; margin: -10px 0; }
+    #controlPanel QLabel#statusLabel { font-weight: bold; padding: 5px; }
+    #controlPanel QLabel#statusLabel[ok="true"] { color: green; }
+    #controlPanel QLabel#statusLabel[ok="false"] { color: red; }
+    #controlPanel QLabel#valueLabel { font-weight: bold; color: #2b2d42; }
+"""
+
+@njit(cache=True, fastmath=True)
+def forward_kinematics(base, shoulder, elbow, wrist):
+    """Return the 4x3 base/shoulder/elbow/wrist joint positions for angles in radians"""
+    cb, sb = cos(base), sin(base)
+    elbow_abs = shoulder + elbow
+
+    # Horizontal reach along the base heading and height of each joint
+    reach1 = L1 * cos(shoulder)
+    reach2 = reach1 + L2 * cos(elbow_abs)
+    reach3 = reach2 + L3 * cos(wrist)
+    z1 = L1 * sin(shoulder)
+    z2 = z1 + L2 * sin(elbow_abs)
+    z3 = z2 + L3 * sin(wrist)
+
+    points = np.zeros((4, 3))
+    points[1, 0], points[1, 1], points[1, 2] = cb * reach1, sb * reach1, z1
+    points[2, 0], points[2, 1], points[2, 2] = cb * reach2, sb * reach2, z2
+    points[3, 0], points[3, 1], points[3, 2] = cb * reach3, sb * reach3, z3
+    return points
+
+# Decoder for incoming JSON messages
+json_loads = orjson.loads if orjson is not None else json.loads
+
 class DetachedPlotWindow(QMainWindow):
     def __init__(self, gui):
         super().__init__()
         self.gui = gui
         self.setWindowTitle("Detached Plot")
         self.setGeometry(300, 300, 600, 600)
-        self.setCentralWidget(gui.canvas)
+        self.setCentralWidget(gui.plot_widget)
 
     def closeEvent(self, event):
         self.gui.reattach_plot()
         event.accept()
 
 class ArmControlGUI(QMainWindow):
+    # Emitted by the WebSocket task, delivered through the Qt event queue
+    ws_state_changed = pyqtSignal(bool)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Arm Control GUI")
@@ -46,9 +137,7 @@ class ArmControlGUI(QMainWindow):
         # Check for gamepads
         self.joystick = None
         if pygame.joystick.get_count() > 0:
-            self.joystick = pygame.joystick.Joystick(0)
-            self.joystick.init()
-            logger.info(f"Gamepad connected: {self.joystick.get_name()}")
+            self.connect_gamepad()
         else:
             logger.warning("No gamepad detected")
 
@@ -61,6 +150,7 @@ class ArmControlGUI(QMainWindow):
         self.base_pwm = 0
         self.shared_pwm = 0
         self.last_values = None
+        self.update_pending = False
 
         # Motor states (0: stop, 1: forward, 2: backward)
         self.base_state = 0
@@ -70,97 +160,123 @@ class ArmControlGUI(QMainWindow):
         # WebSocket client setup
         self.ws = None
         self.ws_connected = False
+        self.last_ws_state = None
+        self.last_gamepad_state = None
         self.shutting_down = False
+        self.ws_state_changed.connect(self.on_ws_state_changed, Qt.QueuedConnection)
         self.setup_websocket_client()
 
         # GUI setup
         self.detached_window = None
+        self.button_groups = []  # Filled by the control builders, used by reset_all
+        self.motor_buttons = {}  # motor_type -> (fwd_btn, bwd_btn), for gamepad updates
         self.main_widget = QWidget()
         self.setCentralWidget(self.main_widget)
         self.main_layout = QHBoxLayout(self.main_widget)
 
         self.init_controls()
         self.init_plot()
+        self.on_ws_state_changed(self.ws_connected)
 
-        # Timer for updates
+        # Timer for gamepad status; state changes are pushed by the controls
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_output)
-        self.timer.start(50)  # Update every 50ms
+        self.timer.timeout.connect(self.refresh_status)
+        self.timer.start(250)  # Refresh every 250ms
+
+        # One-shot timer that caps plot redraws at 10 per second
+        self.last_plot_key = None
+        self.plot_timer = QTimer()
+        self.plot_timer.setSingleShot(True)
+        self.plot_timer.timeout.connect(self.redraw_plot)
         
         # Timer for gamepad updates
         self.gamepad_timer = QTimer()
         self.gamepad_timer.timeout.connect(self.update_gamepad)
-        self.gamepad_timer.start(100)  # Update every 100ms
+        self.gamepad_timer.start(100)  # Poll every 100ms
         
         # Gamepad button state tracking
         self.prev_buttons = [False] * 15  # Track previous button states
         self.hat_state = (0, 0)  # Track D-pad state
-        self.last_gamepad_update = pygame.time.get_ticks()
+
+        # Send and plot the initial state
+        self.schedule_update()
 
     def setup_websocket_client(self):
-        """Setup WebSocket client to connect to the main server"""
-        def on_message(ws, message):
+        """Run the WebSocket client as a task on the Qt (qasync) event loop"""
+        def on_message(message):
+            # Incoming messages are only logged, so skip decoding when INFO is off
+            if not logger.isEnabledFor(logging.INFO):
+                return
             try:
-                if message.startswith('[') or message.startswith('{'):
-                    data = json.loads(message)
-                    logger.info(f"Received from server: {data}")
+                # Only text frames carry JSON; binary frames are logged as-is
+                if isinstance(message, str) and message[:1] in ('[', '{'):
+                    data = json_loads(message)
+                    logger.info("Received from server: %s", data)
                 else:
-                    logger.info(f"Received: {message}")
-            except json.JSONDecodeError:
-                logger.info(f"Received text: {message}")
-
-        def on_open(ws):
-            logger.info("✅ Connected to WebSocket server")
-            self.ws_connected = True
-            ws.send("ARM GUI Connected!")
-
-        def on_error(ws, error):
-            logger.error(f"WebSocket error: {error}")
-            self.ws_connected = False
+                    logger.info("Received: %s", message)
+            except ValueError:  # Also covers JSONDecodeError
+                logger.info("Received text: %s", message)
 
-        def on_close(ws, close_status_code, close_msg):
-            logger.info("Disconnected from WebSocket server")
-            self.ws_connected = False
-
-        def connect_websocket():
+        async def send_messages(ws):
+            if self.send_slot is not None:
+                self.send_ready.set()  # Resend a frame left over from a dropped connection
             while True:
+                await self.send_ready.wait()
+                self.send_ready.clear()
+                message, self.send_slot = self.send_slot, None
+                try:
+                    await ws.send(message)
+                except websockets.exceptions.ConnectionClosed:
+                    # Keep the frame for the next connection unless a newer one replaced it
+                    if self.send_slot is None:
+                        self.send_slot = message
+                    logger.warning("Connection closed while sending, message kept for reconnect")
+                    return
+
+        async def connect_websocket():
+            while not self.shutting_down:
                 try:
                     logger.info("Attempting to connect to WebSocket server...")
-                    self.ws = websocket.WebSocketApp(
-                        "ws://192.168.0.101:8765",  # Connect to main server
-                        on_open=on_open,
-                        on_message=on_message,
-                        on_error=on_error,
-                        on_close=on_close
-                    )
-                    self.ws.run_forever()
-                    
-                    # If we get here, connection was closed
-                    if self.shutting_down:
-                        break
-                        
-                    logger.info("Attempting to reconnect in 5 seconds...")
-                    threading.Event().wait(5)  # Sleep for 5 seconds
-                    
+                    async with websockets.connect("ws://192.168.0.101:8765") as ws:  # Connect to main server
+                        self.ws = ws
+                        logger.info("✅ Connected to WebSocket server")
+                        self.ws_connected = True
+                        self.ws_state_changed.emit(True)
+                        await ws.send("ARM GUI Connected!")
+
+                        sender = asyncio.ensure_future(send_messages(ws))
+                        try:
+                            async for message in ws:
+                                on_message(message)
+                        finally:
+                            sender.cancel()
+                    logger.info("Disconnected from WebSocket server")
                 except Exception as e:
                     logger.error(f"Connection error: {e}")
-                    threading.Event().wait(5)
 
-        # Start WebSocket client in background thread
-        self.ws_thread = threading.Thread(target=connect_websocket, daemon=True)
-        self.ws_thread.start()
+                self.ws = None
+                self.ws_connected = False
+                self.ws_state_changed.emit(False)
+
+                # If we get here, connection was closed
+                if self.shutting_down:
+                    break
+
+                logger.info("Attempting to reconnect in 5 seconds...")
+                await asyncio.sleep(5)
+
+        # Start WebSocket client on the running event loop
+        self.send_slot = None  # Latest unsent message
+        self.send_ready = asyncio.Event()
+        self.ws_task = asyncio.ensure_future(connect_websocket())
 
     def send_websocket_message(self, message):
-        """Send message through WebSocket if connected"""
-        if self.ws_connected and self.ws:
-            try:
-                if isinstance(message, (list, dict)):
-                    message = json.dumps(message)
-                self.ws.send(message)
-                return True
-            except Exception as e:
-                logger.error(f"Failed to send message: {e}")
-                self.ws_connected = False
+        """Hand message to the WebSocket sender if connected, newest message wins"""
+        if self.ws_connected:
+            # The sender task writes it out; the GUI never waits on socket I/O
+            self.send_slot = message
+            self.send_ready.set()
+            return True
         return False
 
     def init_controls(self):
@@ -169,16 +285,17 @@ class ArmControlGUI(QMainWindow):
 
         # Add connection status
         self.status_label = QLabel("🔴 Disconnected")
-        self.status_label.setStyleSheet("font-weight: bold; padding: 5px;")
+        self.status_label.setObjectName("statusLabel")
         control_panel.addWidget(self.status_label)
         
         # Gamepad status
         self.gamepad_status = QLabel("🔴 No gamepad")
-        self.gamepad_status.setStyleSheet("font-weight: bold; padding: 5px;")
+        self.gamepad_status.setObjectName("statusLabel")
         control_panel.addWidget(self.gamepad_status)
 
         # Shared PWM slider for base, shoulder, and elbow motors
-        self.shared_pwm_slider = self.create_pwm_slider("Shared Motor PWM", lambda val: setattr(self, 'shared_pwm', val), 0, 1023)
+        self.shared_pwm_slider, self.shared_pwm_slider_ref, self.shared_pwm_label = self.create_pwm_slider(
+            "Shared Motor PWM", self.set_shared_pwm, 0, 1023)
         control_panel.addWidget(self.shared_pwm_slider)
         
         # Motor control sections
@@ -187,8 +304,12 @@ class ArmControlGUI(QMainWindow):
         control_panel.addWidget(self.create_motor_control("Elbow Motor", 'elbow'))
         
         # Servo control
-        self.servo_slider = self.create_pwm_slider("Wrist Servo (0-180°)", lambda val: setattr(self, 'servo_angle', val), 0, 180)
+        self.servo_slider, self.servo_slider_ref, self.servo_label = self.create_pwm_slider(
+            "Wrist Servo (0-180°)", self.set_servo_angle, 0, 180)
         control_panel.addWidget(self.servo_slider)
+
+        # Sliders and their reset values
+        self.sliders = [(self.shared_pwm_slider_ref, 0), (self.servo_slider_ref, 90)]
         
         # Gripper and Roller controls
         control_panel.addWidget(self.create_gripper_roller_control("Gripper", 'gripper'))
@@ -209,36 +330,125 @@ class ArmControlGUI(QMainWindow):
 
         wrapper = QWidget()
         wrapper.setLayout(control_panel)
-        wrapper.setStyleSheet("""
-            QWidget { background-color: #f4f4f4; font-family: 'Segoe UI', Arial; font-size: 12pt; }
-            QGroupBox { border: 1px solid #cccccc; border-radius: 8px; margin-top: 1.5ex; padding: 10px; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QPushButton { background-color: #2b2d42; color: white; border-radius: 8px; padding: 8px; font-weight: bold; }
-            QPushButton:hover { background-color: #1f2235; }
-            QPushButton:checked { background-color: #4a4d6d; }
-            QSlider::groove:horizontal { background: #cccccc; height: 10px; border-radius: 5px; }
-            QSlider::handle:horizontal { background: #2b2d42; width: 30px; height: 30px; border-radius: 15px; margin: -10px 0; }
-        """)
+        wrapper.setObjectName("controlPanel")
+        # One font for the whole panel, inherited by every control
+        QFont.insertSubstitution("Segoe UI", "Arial")  # Fallback where Segoe UI is missing
+        panel_font = QFont("Segoe UI", 12)
+        wrapper.setFont(panel_font)
         self.main_layout.addWidget(wrapper, 4)
 
     def init_plot(self):
+        # Prefer the OpenGL view; fall back to matplotlib without pyqtgraph/PyOpenGL
+        if gl is not None:
+            self.init_gl_plot()
+        else:
+            self.init_mpl_plot()
+        self.main_layout.addWidget(self.plot_widget, 5)
+
+    def init_gl_plot(self):
+        self.plot_widget = gl.GLViewWidget()
+        self.plot_widget.setCameraPosition(pos=QVector3D(0, 0, 15), distance=70, elevation=20, azimuth=45)
+
+        grid = gl.GLGridItem()
+        grid.setSize(60, 60)
+        grid.setSpacing(5, 5)
+        self.plot_widget.addItem(grid)
+        self.plot_widget.addItem(gl.GLAxisItem(size=QVector3D(10, 10, 10)))
+
+        # Create the arm items once; update_plot only moves them
+        points = np.zeros((4, 3))
+        self.arm_item = gl.GLLinePlotItem(pos=points, color=(0.25, 0.45, 0.69, 1.0),
+                                          width=3, antialias=True, mode='line_strip')
+        self.joint_item = gl.GLScatterPlotItem(pos=points, color=(0.25, 0.45, 0.69, 1.0), size=8)
+        self.plot_widget.addItem(self.arm_item)
+        self.plot_widget.addItem(self.joint_item)
+        self.joint_labels = []
+        for name in ('Base', 'Shoulder', 'Elbow', 'Wrist'):
+            label = gl.GLTextItem(pos=(0, 0, 0), text=name)
+            self.plot_widget.addItem(label)
+            self.joint_labels.append(label)
+
+    def init_mpl_plot(self):
         self.figure = Figure(figsize=(6, 6))
-        self.canvas = FigureCanvas(self.figure)
+        self.plot_widget = FigureCanvas(self.figure)
+        if MPL_PLOT_3D:
+            self.init_mpl_axes_3d()
+        else:
+            self.init_mpl_axes_2d()
+
+        # Blit the arm over a cached background instead of redrawing the axes
+        self.arm_artists = [self.arm_line, *self.joint_labels]
+        for artist in self.arm_artists:
+            artist.set_animated(True)
+        self.plot_background = None
+        self.plot_widget.mpl_connect('draw_event', self.on_plot_draw)
+
+    def init_mpl_axes_3d(self):
         self.ax = self.figure.add_subplot(111, projection='3d')
-        self.main_layout.addWidget(self.canvas, 5)
+
+        # Create the arm artists once; update_plot only moves them
+        self.arm_line, = self.ax.plot([0] * 4, [0] * 4, [0] * 4,
+                                      color='#3f72af', marker='o', linewidth=3, markersize=8)
+        self.joint_labels = [
+            self.ax.text(0, 0, 0, name, fontsize=8)
+            for name in ('Base', 'Shoulder', 'Elbow', 'Wrist')
+        ]
+
+        # Set limits and labels
+        self.ax.set_xlim(-30, 30)
+        self.ax.set_ylim(-30, 30)
+        self.ax.set_zlim(0, 50)
+        self.ax.set_xlabel("X")
+        self.ax.set_ylabel("Y")
+        self.ax.set_zlabel("Z")
+        self.ax.set_title("3D Arm Position")
+        self.ax.grid(True)
+
+    def init_mpl_axes_2d(self):
+        self.ax = self.figure.add_subplot(111)
+
+        # Projected world axes as a static reference
+        for name, end in (('X', (30, 0, 0)), ('Y', (0, 30, 0)), ('Z', (0, 0, 30))):
+            u, v = np.array(end, dtype=float) @ PLOT_PROJECTION
+            self.ax.plot([0, u], [0, v], color='#aaaaaa', linewidth=1)
+            self.ax.text(u, v, name, color='#888888', fontsize=8)
+
+        # Create the arm artists once; update_plot only moves them
+        self.arm_line, = self.ax.plot([0] * 4, [0] * 4,
+                                      color='#3f72af', marker='o', linewidth=3, markersize=8)
+        self.joint_labels = [
+            self.ax.text(0, 0, name, fontsize=8)
+            for name in ('Base', 'Shoulder', 'Elbow', 'Wrist')
+        ]
+
+        # Set limits and labels
+        self.ax.set_xlim(-30, 30)
+        self.ax.set_ylim(-20, 40)
+        self.ax.set_aspect('equal')
+        self.ax.set_axis_off()
+        self.ax.set_title("Arm Position")
+
+    def on_plot_draw(self, event):
+        # Full redraws (first show, resize, view rotation) refresh the cached background
+        self.plot_background = self.plot_widget.copy_from_bbox(self.figure.bbox)
+        self.draw_arm_artists()
+
+    def draw_arm_artists(self):
+        for artist in self.arm_artists:
+            self.ax.draw_artist(artist)
 
     def reattach_plot(self):
         if self.detached_window:
             self.detached_window.close()
             self.detached_window = None
-            self.main_layout.addWidget(self.canvas, 5)
+            self.main_layout.addWidget(self.plot_widget, 5)
             self.detach_btn.setText("Detach Plot")
 
     def toggle_plot_detach(self):
         if self.detached_window:
             self.reattach_plot()
         else:
-            self.main_layout.removeWidget(self.canvas)
+            self.main_layout.removeWidget(self.plot_widget)
             self.detached_window = DetachedPlotWindow(self)
             self.detached_window.show()
             self.detach_btn.setText("Attach Plot")
@@ -250,7 +460,7 @@ class ArmControlGUI(QMainWindow):
         # Add value label
         value_label = QLabel(f"{(min_val + max_val) // 2}")
         value_label.setAlignment(Qt.AlignCenter)
-        value_label.setStyleSheet("font-weight: bold; color: #2b2d42;")
+        value_label.setObjectName("valueLabel")
         
         slider = QSlider(Qt.Horizontal)
         slider.setMinimum(min_val)
@@ -258,25 +468,31 @@ class ArmControlGUI(QMainWindow):
         slider.setValue((min_val + max_val) // 2)
         slider.setMinimumHeight(35)
         
-        def on_value_change(val):
-            value_label.setText(str(val))
+        # Default arguments make the per-drag-step lookups plain locals
+        def on_value_change(val, set_text=value_label.setText, callback=callback,
+                            schedule_update=self.schedule_update):
+            set_text(str(val))
             callback(val)
+            schedule_update()
         
         slider.valueChanged.connect(on_value_change)
+
+        # While dragging, only the label follows the handle; the value is applied on release
+        slider.setTracking(False)
+        slider.sliderMoved.connect(lambda val, set_text=value_label.setText: set_text(str(val)))
         
         layout.addWidget(value_label)
         layout.addWidget(slider)
         group.setLayout(layout)
         
-        # Store slider and label for gamepad updates
-        if label == "Shared Motor PWM":
-            self.shared_pwm_label = value_label
-            self.shared_pwm_slider_ref = slider
-        elif label == "Wrist Servo (0-180°)":
-            self.servo_label = value_label
-            self.servo_slider_ref = slider
-            
-        return group
+        # Slider and label are returned for gamepad updates and reset
+        return group, slider, value_label
+
+    def set_shared_pwm(self, val):
+        self.shared_pwm = val
+
+    def set_servo_angle(self, val):
+        self.servo_angle = val
 
     def create_motor_control(self, name, motor_type):
         group = QGroupBox(name)
@@ -299,21 +515,14 @@ class ArmControlGUI(QMainWindow):
         btn_group.addButton(fwd_btn, 1)
         btn_group.addButton(bwd_btn, 2)
         btn_group.setExclusive(True)
+        self.button_groups.append(btn_group)
         
         layout.addWidget(fwd_btn)
         layout.addWidget(bwd_btn)
         group.setLayout(layout)
         
         # Store buttons for gamepad updates
-        if motor_type == 'base':
-            self.base_fwd_btn = fwd_btn
-            self.base_bwd_btn = bwd_btn
-        elif motor_type == 'shoulder':
-            self.shoulder_fwd_btn = fwd_btn
-            self.shoulder_bwd_btn = bwd_btn
-        elif motor_type == 'elbow':
-            self.elbow_fwd_btn = fwd_btn
-            self.elbow_bwd_btn = bwd_btn
+        self.motor_buttons[motor_type] = (fwd_btn, bwd_btn)
             
         return group
 
@@ -345,6 +554,7 @@ class ArmControlGUI(QMainWindow):
         btn_group.addButton(close_btn, 1)
         btn_group.addButton(stop_btn, 0)
         btn_group.setExclusive(True)
+        self.button_groups.append(btn_group)
         stop_btn.setChecked(True)  # Default to stop
         
         layout.addWidget(open_btn)
@@ -365,36 +575,28 @@ class ArmControlGUI(QMainWindow):
         return group
 
     def set_motor_state(self, motor_type, state):
-        if motor_type == 'base':
-            self.base_state = state
-        elif motor_type == 'shoulder':
-            self.shoulder_state = state
-        elif motor_type == 'elbow':
-            self.elbow_state = state
+        setattr(self, MOTOR_STATE_ATTRS[motor_type], state)
+        self.schedule_update()
 
     def set_gripper_roller_state(self, control_type, state):
-        if control_type == 'gripper':
-            self.gripper_state = state
-        elif control_type == 'roller':
-            self.roller_state = state
-
-    def get_direction_and_value(self, state):
-        if state == 1:  # Forward
-            return [1, self.shared_pwm]
-        elif state == 2:  # Backward
-            return [0, self.shared_pwm]
-        else:  # Stop
-            return [0, 0]
+        setattr(self, GRIPPER_ROLLER_STATE_ATTRS[control_type], state)
+        self.schedule_update()
 
     def get_current_values(self):
-        return [
+        # Flat tuple of scalars with signed motor PWMs, cheap to compare
+        pwm = self.shared_pwm
+        return (
             self.gripper_state,
             self.roller_state,
             self.servo_angle,
-            self.get_direction_and_value(self.elbow_state),
-            self.get_direction_and_value(self.shoulder_state),
-            self.get_direction_and_value(self.base_state),
-        ]
+            pwm * MOTOR_DIRECTION[self.elbow_state],
+            pwm * MOTOR_DIRECTION[self.shoulder_state],
+            pwm * MOTOR_DIRECTION[self.base_state],
+        )
+
+    def build_payload(self, values):
+        # Fixed 10-byte little-endian frame; the sign of each PWM encodes direction
+        return ARM_FRAME.pack(*values)
 
     def reset_all(self):
         # Reset motor states
@@ -413,93 +615,124 @@ class ArmControlGUI(QMainWindow):
         self.shared_pwm = 0
         
         # Reset UI components
-        for widget in self.findChildren(QSlider):
-            if widget.minimum() == 0 and widget.maximum() == 180:  # Servo slider
-                widget.setValue(90)
-            else:  # PWM sliders
-                widget.setValue(0)
+        for slider, default in self.sliders:
+            slider.setValue(default)
         
         # Reset button groups
-        for btn_group in self.findChildren(QButtonGroup):
-            btn_group.setExclusive(False)
-            for button in btn_group.buttons():
-                button.setChecked(False)
-            btn_group.setExclusive(True)
-            
-            # Set stop buttons to checked
-            for button in btn_group.buttons():
-                if btn_group.id(button) == 0:
-                    button.setChecked(True)
-
-    def update_output(self):
-        values = self.get_current_values()
-        
-        # Update connection status
-        if self.ws_connected:
-            self.status_label.setText("🟢 Connected")
-            self.status_label.setStyleSheet("font-weight: bold; padding: 5px; color: green;")
+        for btn_group in self.button_groups:
+            stop_btn = btn_group.button(0)
+            checked_btn = btn_group.checkedButton()
+            if stop_btn is not None:
+                # Checking the stop button unchecks the rest of the exclusive group
+                stop_btn.setChecked(True)
+            elif checked_btn is not None:
+                # Without a stop button the group has to be cleared non-exclusively
+                btn_group.setExclusive(False)
+                checked_btn.setChecked(False)
+                btn_group.setExclusive(True)
+
+        self.schedule_update()
+
+    def schedule_update(self):
+        """Coalesce control changes into a single update on the next event loop pass"""
+        if not self.update_pending:
+            self.update_pending = True
+            QTimer.singleShot(0, self.flush_state)
+
+    def set_status(self, label, text, ok):
+        """Set a status label's text and colour via the app stylesheet's [ok] rules"""
+        label.setText(text)
+        label.setProperty("ok", ok)
+        label.style().unpolish(label)
+        label.style().polish(label)
+
+    def on_ws_state_changed(self, connected):
+        # Update connection status only when it changes
+        if connected == self.last_ws_state:
+            return
+        self.last_ws_state = connected
+        if connected:
+            self.set_status(self.status_label, "🟢 Connected", True)
         else:
-            self.status_label.setText("🔴 Disconnected") 
-            self.status_label.setStyleSheet("font-weight: bold; padding: 5px; color: red;")
-        
-        # Update gamepad status
-        if self.joystick:
-            self.gamepad_status.setText("🟢 Gamepad connected")
-            self.gamepad_status.setStyleSheet("font-weight: bold; padding: 5px; color: green;")
+            self.set_status(self.status_label, "🔴 Disconnected", False)
+
+    def refresh_status(self):
+        # Update gamepad status only when it changes
+        gamepad_connected = self.joystick is not None
+        if gamepad_connected == self.last_gamepad_state:
+            return
+        self.last_gamepad_state = gamepad_connected
+        if gamepad_connected:
+            self.set_status(self.gamepad_status, "🟢 Gamepad connected", True)
         else:
-            self.gamepad_status.setText("🔴 No gamepad")
-            self.gamepad_status.setStyleSheet("font-weight: bold; padding: 5px; color: red;")
-        
+            self.set_status(self.gamepad_status, "🔴 No gamepad", False)
+
+    def flush_state(self):
+        self.update_pending = False
+        values = self.get_current_values()
+
         # Only send and update if values changed
         if values != self.last_values:
-            print(f"ARM Values: {values}")
+            logger.debug("ARM Values: %s", values)
             
             # Send via WebSocket
-            self.send_websocket_message(values)
+            self.send_websocket_message(self.build_payload(values))
             
-            # Update plot
-            self.update_plot(values)
             self.last_values = values
 
+            # Schedule a plot redraw unless one is already pending
+            if not self.plot_timer.isActive():
+                self.plot_timer.start(100)
+
+    def redraw_plot(self):
+        # Gripper and roller do not move the plotted arm
+        plot_key = self.last_values[2:]
+        if plot_key != self.last_plot_key:
+            self.last_plot_key = plot_key
+            self.update_plot(self.last_values)
+
     def update_plot(self, values):
-        _, _, wrist, elbow, shoulder, base = values
-        base_angle = (base[0]*2 - 1) * (base[1] / 1023) * 90
-        shoulder_angle = (shoulder[0]*2 - 1) * (shoulder[1] / 1023) * 90
-        elbow_angle = (elbow[0]*2 - 1) * (elbow[1] / 1023) * 90
-
-        x0, y0, z0 = 0, 0, 0
-        x1 = L1 * np.cos(np.radians(base_angle)) * np.cos(np.radians(shoulder_angle))
-        y1 = L1 * np.sin(np.radians(base_angle)) * np.cos(np.radians(shoulder_angle))
-        z1 = L1 * np.sin(np.radians(shoulder_angle))
-
-        x2 = x1 + L2 * np.cos(np.radians(base_angle)) * np.cos(np.radians(shoulder_angle + elbow_angle))
-        y2 = y1 + L2 * np.sin(np.radians(base_angle)) * np.cos(np.radians(shoulder_angle + elbow_angle))
-        z2 = z1 + L2 * np.sin(np.radians(shoulder_angle + elbow_angle))
-
-        x3 = x2 + L3 * np.cos(np.radians(base_angle)) * np.cos(np.radians(wrist))
-        y3 = y2 + L3 * np.sin(np.radians(base_angle)) * np.cos(np.radians(wrist))
-        z3 = z2 + L3 * np.sin(np.radians(wrist))
-
-        self.ax.cla()
-        self.ax.plot([x0, x1, x2, x3], [y0, y1, y2, y3], [z0, z1, z2, z3], 
-                    color='#3f72af', marker='o', linewidth=3, markersize=8)
-        
-        # Add joint labels
-        self.ax.text(x0, y0, z0, 'Base', fontsize=8)
-        self.ax.text(x1, y1, z1, 'Shoulder', fontsize=8)
-        self.ax.text(x2, y2, z2, 'Elbow', fontsize=8)
-        self.ax.text(x3, y3, z3, 'Wrist', fontsize=8)
-        
-        # Set limits and labels
-        self.ax.set_xlim(-30, 30)
-        self.ax.set_ylim(-30, 30)
-        self.ax.set_zlim(0, 50)
-        self.ax.set_xlabel("X")
-        self.ax.set_ylabel("Y")
-        self.ax.set_zlabel("Z")
-        self.ax.set_title("3D Arm Position")
-        self.ax.grid(True)
-        self.canvas.draw()
+        _, _, wrist, elbow_pwm, shoulder_pwm, base_pwm = values
+        points = forward_kinematics(base_pwm * PWM_TO_RAD, shoulder_pwm * PWM_TO_RAD,
+                                    elbow_pwm * PWM_TO_RAD, wrist * DEG_TO_RAD)
+
+        if gl is not None:
+            self.arm_item.setData(pos=points)
+            self.joint_item.setData(pos=points)
+            for label, pos in zip(self.joint_labels, points):
+                label.setData(pos=pos)
+        else:
+            if MPL_PLOT_3D:
+                self.arm_line.set_data_3d(points[:, 0], points[:, 1], points[:, 2])
+                for label, pos in zip(self.joint_labels, points):
+                    label.set_position_3d(pos)
+            else:
+                projected = points @ PLOT_PROJECTION
+                self.arm_line.set_data(projected[:, 0], projected[:, 1])
+                for label, pos in zip(self.joint_labels, projected):
+                    label.set_position(pos)
+            if self.plot_background is None:
+                self.plot_widget.draw_idle()
+            else:
+                self.plot_widget.restore_region(self.plot_background)
+                self.draw_arm_artists()
+                self.plot_widget.blit(self.figure.bbox)
+
+    def set_slider_value(self, slider, value_label, value):
+        """Move a slider from code without round-tripping through its valueChanged handler"""
+        blocker = QSignalBlocker(slider)
+        slider.setValue(value)
+        blocker.unblock()
+        value_label.setText(str(value))
+        self.schedule_update()
+
+    def connect_gamepad(self):
+        """Open the first gamepad and cache its layout, which does not change"""
+        self.joystick = pygame.joystick.Joystick(0)
+        self.joystick.init()
+        self.num_buttons = self.joystick.get_numbuttons()
+        self.has_hat = self.joystick.get_numhats() > 0
+        logger.info(f"Gamepad connected: {self.joystick.get_name()}")
 
     def update_gamepad(self):
         """Process gamepad inputs"""
@@ -507,64 +740,50 @@ class ArmControlGUI(QMainWindow):
             # Try to reconnect if gamepad wasn't detected at startup
             pygame.joystick.init()
             if pygame.joystick.get_count() > 0:
-                self.joystick = pygame.joystick.Joystick(0)
-                self.joystick.init()
-                logger.info(f"Gamepad connected: {self.joystick.get_name()}")
+                self.connect_gamepad()
             return
             
-        # Process pygame events
-        for event in pygame.event.get():
-            pass  # We're using state polling instead of events
+        # Pump SDL so device state updates and flush the unread event queue,
+        # which would otherwise fill up and start dropping device events
+        pygame.event.clear()
         
         try:
             # Get current button states
-            buttons = [self.joystick.get_button(i) for i in range(self.joystick.get_numbuttons())]
-            hats = self.joystick.get_numhats()
+            get_button = self.joystick.get_button
+            buttons = [get_button(i) for i in range(self.num_buttons)]
             hat_state = (0, 0)
-            if hats > 0:
+            if self.has_hat:
                 hat_state = self.joystick.get_hat(0)  # D-pad state
             
             # Xbox controller mappings for your controller:
             # Buttons: [Y, B, A, X, LB, RB, LT, RT, BACK, START, L, R]
             # Indices:  0  1  2  3  4   5   6   7    8      9     10 11
             
-            # Continuous adjustment for triggers
-            current_time = pygame.time.get_ticks()
-            time_since_last = current_time - self.last_gamepad_update
-            if time_since_last < 50:  # Only update every 50ms for smooth control
-                return
-            
-            self.last_gamepad_update = current_time
-            
             # Shared PWM control with RT/LT
             if buttons[7]:  # RT (button 7) - increase shared PWM
                 new_pwm = min(1023, self.shared_pwm + 10)
                 if new_pwm != self.shared_pwm:
                     self.shared_pwm = new_pwm
-                    self.shared_pwm_slider_ref.setValue(self.shared_pwm)
-                    self.shared_pwm_label.setText(str(self.shared_pwm))
+                    self.set_slider_value(self.shared_pwm_slider_ref, self.shared_pwm_label, new_pwm)
                     
             if buttons[6]:  # LT (button 6) - decrease shared PWM
                 new_pwm = max(0, self.shared_pwm - 10)
                 if new_pwm != self.shared_pwm:
                     self.shared_pwm = new_pwm
-                    self.shared_pwm_slider_ref.setValue(self.shared_pwm)
-                    self.shared_pwm_label.setText(str(self.shared_pwm))
+                    self.set_slider_value(self.shared_pwm_slider_ref, self.shared_pwm_label, new_pwm)
             
             # Wrist servo control with RB/LB
             if buttons[5]:  # RB (button 5) - increase wrist servo
                 new_angle = min(180, self.servo_angle + 1)
                 if new_angle != self.servo_angle:
                     self.servo_angle = new_angle
-                    self.servo_slider_ref.setValue(self.servo_angle)
-                    self.servo_label.setText(str(self.servo_angle))
+                    self.set_slider_value(self.servo_slider_ref, self.servo_label, new_angle)
                     
             if buttons[4]:  # LB (button 4) - decrease wrist servo
                 new_angle = max(0, self.servo_angle - 1)
                 if new_angle != self.servo_angle:
                     self.servo_angle = new_angle
-                    self.servo_slider_ref.setValue(self.servo_angle)
-                    self.servo_label.setText(str(self.servo_angle))
+                    self.set_slider_value(self.servo_slider_ref, self.servo_label, new_angle)
             
             # Motor controls (B, Y, X) - toggle on press
             if buttons[1] and not self.prev_buttons[1]:  # B button (index 1) - base motor
@@ -613,49 +832,40 @@ class ArmControlGUI(QMainWindow):
 
     def cycle_motor_state(self, motor_type):
         """Cycle motor state: stop -> forward -> backward -> stop"""
-        current_state = getattr(self, f"{motor_type}_state")
-        new_state = (current_state + 1) % 3
-        setattr(self, f"{motor_type}_state", new_state)
+        state_attr = MOTOR_STATE_ATTRS[motor_type]
+        new_state = (getattr(self, state_attr) + 1) % 3
+        setattr(self, state_attr, new_state)
+        self.schedule_update()
         
         # Update UI buttons
-        if motor_type == 'base':
-            if new_state == 1:
-                self.base_fwd_btn.setChecked(True)
-            elif new_state == 2:
-                self.base_bwd_btn.setChecked(True)
-            else:
-                self.base_fwd_btn.setChecked(False)
-                self.base_bwd_btn.setChecked(False)
-                
-        elif motor_type == 'shoulder':
-            if new_state == 1:
-                self.shoulder_fwd_btn.setChecked(True)
-            elif new_state == 2:
-                self.shoulder_bwd_btn.setChecked(True)
-            else:
-                self.shoulder_fwd_btn.setChecked(False)
-                self.shoulder_bwd_btn.setChecked(False)
-                
-        elif motor_type == 'elbow':
-            if new_state == 1:
-                self.elbow_fwd_btn.setChecked(True)
-            elif new_state == 2:
-                self.elbow_bwd_btn.setChecked(True)
-            else:
-                self.elbow_fwd_btn.setChecked(False)
-                self.elbow_bwd_btn.setChecked(False)
+        fwd_btn, bwd_btn = self.motor_buttons[motor_type]
+        fwd_btn.setChecked(new_state == 1)
+        bwd_btn.setChecked(new_state == 2)
 
-    def closeEvent(self, event):
-        """Clean shutdown when GUI is closed"""
-        logger.info("Shutting down ARM Control GUI...")
-        self.shutting_down = True
-        
+    async def close_websocket(self):
+        """Say goodbye to the server, stop the client task, then finish closing the window"""
         if self.ws_connected and self.ws:
             try:
-                self.ws.send("ARM GUI Disconnecting...")
-                self.ws.close()
-            except:
+                await asyncio.wait_for(self.ws.send("ARM GUI Disconnecting..."), 1)
+                await asyncio.wait_for(self.ws.close(), 1)
+            except Exception:
                 pass
+
+        # Cancelling also interrupts a pending connect or the reconnect wait
+        self.ws_task.cancel()
+        await asyncio.wait({self.ws_task})
+        self.close()
+
+    def closeEvent(self, event):
+        """Clean shutdown when GUI is closed"""
+        if not self.shutting_down:
+            logger.info("Shutting down ARM Control GUI...")
+            self.shutting_down = True
+
+            # Close again once the client task has finished on the event loop
+            event.ignore()
+            asyncio.ensure_future(self.close_websocket())
+            return
         
         # Clean up pygame
         pygame.quit()
@@ -664,6 +874,15 @@ class ArmControlGUI(QMainWindow):
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+
+    # Run asyncio (WebSocket client) and Qt on the same event loop
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    app_closed = asyncio.Event()
+    app.aboutToQuit.connect(app_closed.set)
+
     window = ArmControlGUI()
     window.show()
-    sys.exit(app.exec_())
+    with loop:
+        loop.run_until_complete(app_closed.wait())
@@ -18,8 +18,8 @@ async def handler(websocket):
     try:
         async for message in websocket:
             try:
-                # Validate JSON if needed
-                if message.startswith('{') or message.startswith('['):
+                # Validate JSON if needed (binary arm frames are relayed as-is)
+                if isinstance(message, str) and (message.startswith('{') or message.startswith('[')):
                     json.loads(message)  # Validate JSON format
                 
                 logger.info(f"Broadcasting message from {client_addr}: {message}")
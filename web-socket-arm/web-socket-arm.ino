@@ -227,22 +227,22 @@ void servoSweepTest() {
     Serial.println("Servo sweep test completed");
 }
 
-// Process arm control data from WebSocket
-void processArmControl(JsonArray armData) {
-    if (armData.size() < 6) {
-        Serial.println("❌ Invalid arm control data - insufficient parameters");
-        return;
+// Drive a PWM motor from a direction/value pair
+void driveMotor(int dir, int pwm, void (*forward)(int), void (*backward)(int), void (*off)()) {
+    if (pwm == 0) {
+        off();
+    } else if (dir == 1) {
+        forward(pwm);
+    } else {
+        backward(pwm);
     }
-    
-    // Extract control data
-    int gripper_state = armData[0].as<int>();
-    int roller_state = armData[1].as<int>();
-    int servo_angle = armData[2].as<int>();
-    
-    JsonArray elbow_data = armData[3];
-    JsonArray shoulder_data = armData[4];
-    JsonArray base_data = armData[5];
-    
+}
+
+// Apply a decoded arm control command to the hardware
+void applyArmControl(int gripper_state, int roller_state, int servo_angle,
+                     int elbow_dir, int elbow_pwm,
+                     int shoulder_dir, int shoulder_pwm,
+                     int base_dir, int base_pwm) {
     // Control gripper (0 = open/forward, 1 = close/backward)
     if (gripper_state == 1) {
         gripper_backward();  // Close gripper
@@ -260,49 +260,63 @@ void processArmControl(JsonArray armData) {
     // Control servo
     setServoAngle(servo_angle);
     
-    // Control elbow motor
-    if (elbow_data.size() >= 2) {
-        int elbow_dir = elbow_data[0].as<int>();
-        int elbow_pwm = elbow_data[1].as<int>();
-        
-        if (elbow_pwm == 0) {
-            elbow_off();
-        } else if (elbow_dir == 1) {
-            elbow_forward(elbow_pwm);
-        } else {
-            elbow_backward(elbow_pwm);
-        }
+    // Control elbow, shoulder and base motors
+    driveMotor(elbow_dir, elbow_pwm, elbow_forward, elbow_backward, elbow_off);
+    driveMotor(shoulder_dir, shoulder_pwm, shoulder_forward, shoulder_backward, shoulder_off);
+    driveMotor(base_dir, base_pwm, base_forward, base_backward, base_off);
+    
+    Serial.printf("🤖 Servo angle: %d°\n", servo_angle);
+}
+
+// Process arm control data from WebSocket (JSON layout):
+// [gripper, roller, servo, [e_dir, e_val], [s_dir, s_val], [b_dir, b_val]]
+void processArmControl(JsonArray armData) {
+    if (armData.size() < 6) {
+        Serial.println("❌ Invalid arm control data - insufficient parameters");
+        return;
     }
     
-    // Control shoulder motor
-    if (shoulder_data.size() >= 2) {
-        int shoulder_dir = shoulder_data[0].as<int>();
-        int shoulder_pwm = shoulder_data[1].as<int>();
-        
-        if (shoulder_pwm == 0) {
-            shoulder_off();
-        } else if (shoulder_dir == 1) {
-            shoulder_forward(shoulder_pwm);
-        } else {
-            shoulder_backward(shoulder_pwm);
-        }
+    JsonArray elbow_data = armData[3];
+    JsonArray shoulder_data = armData[4];
+    JsonArray base_data = armData[5];
+    
+    if (elbow_data.size() < 2 || shoulder_data.size() < 2 || base_data.size() < 2) {
+        Serial.println("❌ Invalid arm control data - malformed motor entries");
+        return;
     }
     
-    // Control base motor
-    if (base_data.size() >= 2) {
-        int base_dir = base_data[0].as<int>();
-        int base_pwm = base_data[1].as<int>();
-        
-        if (base_pwm == 0) {
-            base_off();
-        } else if (base_dir == 1) {
-            base_forward(base_pwm);
-        } else {
-            base_backward(base_pwm);
-        }
+    applyArmControl(armData[0].as<int>(), armData[1].as<int>(), armData[2].as<int>(),
+                    elbow_data[0].as<int>(), elbow_data[1].as<int>(),
+                    shoulder_data[0].as<int>(), shoulder_data[1].as<int>(),
+                    base_data[0].as<int>(), base_data[1].as<int>());
+}
+
+// Binary arm control frame sent by gui.py (struct format '<BBHhhh', 10 bytes)
+// The sign of each motor PWM encodes its direction
+struct __attribute__((packed)) ArmFrame {
+    uint8_t gripper_state;
+    uint8_t roller_state;
+    uint16_t servo_angle;
+    int16_t elbow_pwm;
+    int16_t shoulder_pwm;
+    int16_t base_pwm;
+};
+
+// Process a binary arm control frame from WebSocket
+void processArmFrame(const char* data, size_t length) {
+    if (length != sizeof(ArmFrame)) {
+        Serial.printf("❌ Invalid arm control frame - expected %u bytes, got %u\n",
+                      (unsigned) sizeof(ArmFrame), (unsigned) length);
+        return;
     }
     
-    Serial.printf("🤖 Servo angle: %d°\n", servo_angle);
+    ArmFrame frame;
+    memcpy(&frame, data, sizeof(frame));
+    
+    applyArmControl(frame.gripper_state, frame.roller_state, frame.servo_angle,
+                    frame.elbow_pwm > 0, abs(frame.elbow_pwm),
+                    frame.shoulder_pwm > 0, abs(frame.shoulder_pwm),
+                    frame.base_pwm > 0, abs(frame.base_pwm));
 }
 
 // Process serial commands (for manual testing)
@@ -350,6 +364,16 @@ void onMessageCallback(WebsocketsMessage message) {
     Serial.println("=== Received Message ===");
     Serial.print("Type: ");
     Serial.println(message.isText() ? "Text" : "Binary");
+    
+    // Binary frames carry arm control data
+    if (message.isBinary()) {
+        const std::string& raw = message.rawData();
+        Serial.println("🤖 ARM CONTROL FRAME RECEIVED:");
+        processArmFrame(raw.data(), raw.size());
+        Serial.println("========================");
+        return;
+    }
+    
     Serial.print("Data: ");
     Serial.println(message.data());
     